@@ -28,7 +28,8 @@ async def handleAudioMessage(conn, audio):
     if conn.client_voice_stop:
         conn.client_abort = False
         conn.asr_server_receive = False
-        text, file_path = conn.asr.speech_to_text(conn.asr_audio, conn.session_id)
+        # 语音识别较耗时，放到线程中执行避免阻塞事件循环
+        text, file_path = await asyncio.to_thread(conn.asr.speech_to_text, conn.asr_audio, conn.session_id)
         logger.bind(tag=TAG).info(f"识别文本: {text}")
         text_len, text_without_punctuation = remove_punctuation_and_length(text)
         if text_len <= conn.max_cmd_length and await handleCMDMessage(conn, text_without_punctuation):
@@ -28,7 +28,7 @@ class LLMProvider(LLMProviderBase):
                 "query": last_msg["content"],
                 "stream": True
             }
-            logger.bind(tag=TAG).info(f"发送到 Coze API 的请求数据: {json.dumps(data, ensure_ascii=False)}")
+            logger.bind(tag=TAG).debug("发送到 Coze API 的请求数据: {}", data)
             
             headers = {
                 'Authorization': f'Bearer {self.personal_access_token}',
@@ -44,7 +44,7 @@ class LLMProvider(LLMProviderBase):
                 json=data,
                 stream=True
             )
-            logger.bind(tag=TAG).info(f"请求状态: {response.status_code}")
+            logger.bind(tag=TAG).debug("请求状态: {}", response.status_code)
             
             if response.status_code == 200:
                 # 对每一行流数据进行处理，不做跨块累积
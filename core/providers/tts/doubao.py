@@ -19,11 +19,8 @@ class TTSProvider(TTSProviderBase):
         self.api_url = f"https://{self.host}/api/v1/tts"
         self.header = {"Authorization": f"Bearer;{self.access_token}"}
 
-    def generate_filename(self, extension=".wav"):
-        return os.path.join(self.output_file, f"tts-{datetime.now().date()}@{uuid.uuid4().hex}{extension}")
-
-    async def text_to_speak(self, text, output_file):
-        request_json = {
+        # 除request外的请求字段均为固定配置，只构造一次
+        self.request_template = {
             "app": {
                 "appid": self.appid,
                 "token": "access_token",
@@ -38,17 +35,23 @@ class TTSProvider(TTSProviderBase):
                 "speed_ratio": 1.0,
                 "volume_ratio": 1.0,
                 "pitch_ratio": 1.0,
-            },
-            "request": {
-                "reqid": str(uuid.uuid4()),
-                "text": text,
-                "text_type": "plain",
-                "operation": "query",
-                "with_frontend": 1,
-                "frontend_type": "unitTson"
             }
         }
 
+    def generate_filename(self, extension=".wav"):
+        return os.path.join(self.output_file, f"tts-{datetime.now().date()}@{uuid.uuid4().hex}{extension}")
+
+    async def text_to_speak(self, text, output_file):
+        request_json = self.request_template.copy()
+        request_json["request"] = {
+            "reqid": str(uuid.uuid4()),
+            "text": text,
+            "text_type": "plain",
+            "operation": "query",
+            "with_frontend": 1,
+            "frontend_type": "unitTson"
+        }
+
         resp = requests.post(self.api_url, json.dumps(request_json), headers=self.header)
         if "data" in resp.json():
             data = resp.json()["data"]
@@ -10,8 +10,12 @@ from typing_extensions import Annotated
 from datetime import datetime
 from typing import Literal
 # from base import TTSProviderBase
+from config.logger import setup_logging
 from core.providers.tts.base import TTSProviderBase
 
+TAG = __name__
+logger = setup_logging()
+
 
 class ServeReferenceAudio(BaseModel):
     audio: bytes
@@ -146,7 +150,6 @@ class TTSProvider(TTSProviderBase):
 
 
         else:
-            print(f"Request failed with status code {response.status_code}")
-            print(response.json())
+            logger.bind(tag=TAG).error(f"FishSpeech TTS请求失败: {response.status_code} - {response.text}")
 
 
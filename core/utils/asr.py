@@ -1,11 +1,13 @@
 import time
 import wave
 import os
+import threading
 from abc import ABC, abstractmethod
 from config.logger import setup_logging
 from typing import Optional, Tuple, List
 import uuid
 
+import numpy as np
 import opuslib
 from funasr import AutoModel
 from funasr.utils.postprocess_utils import rich_transcription_postprocess
@@ -13,6 +15,26 @@ from funasr.utils.postprocess_utils import rich_transcription_postprocess
 TAG = __name__
 logger = setup_logging()
 
+# 60ms静音帧（960个16bit采样点），用于替代DTX静音包的解码结果
+SILENCE_PCM_FRAME = bytes(960 * 2)
+
+
+def trim_silence(audio: np.ndarray, threshold: float, padding: int, window: int = 160) -> np.ndarray:
+    """按10ms窗口的RMS能量裁剪首尾静音，前后各保留padding个窗口"""
+    n_windows = len(audio) // window
+    if n_windows == 0:
+        return audio
+    frames = audio[:n_windows * window].reshape(n_windows, window).astype(np.float32)
+    voiced = np.flatnonzero(np.mean(frames * frames, axis=1) >= threshold * threshold)
+    if len(voiced) == 0:
+        # 整段都低于阈值时不做裁剪，交由模型判断
+        return audio
+    start = max(voiced[0] - padding, 0) * window
+    end = min(voiced[-1] + 1 + padding, n_windows) * window
+    if end == n_windows * window:
+        end = len(audio)
+    return audio[start:end]
+
 class ASR(ABC):
     @abstractmethod
     def save_audio_to_file(self, opus_data: List[bytes], session_id: str) -> str:
@@ -21,7 +43,7 @@ class ASR(ABC):
 
     @abstractmethod
     def speech_to_text(self, opus_data: List[bytes], session_id: str) -> Tuple[Optional[str], Optional[str]]:
-        """将语音数据转换为文本"""
+        """将语音数据转换为文本，返回(识别文本, 音频文件路径)"""
         pass
 
 
@@ -30,9 +52,14 @@ class FunASR(ASR):
         self.model_dir = config.get("model_dir")
         self.output_dir = config.get("output_dir")  # 修正配置键名
         self.delete_audio_file = delete_audio_file
+        # 首尾静音裁剪配置
+        self.trim_silence_enabled = config.get("trim_silence", False)
+        self.trim_silence_threshold = config.get("trim_silence_threshold", 200)
+        self.trim_silence_padding_ms = config.get("trim_silence_padding_ms", 300)
 
-        # 确保输出目录存在
-        os.makedirs(self.output_dir, exist_ok=True)
+        self.decoder = opuslib.Decoder(16000, 1)  # 16kHz, 单声道
+        # 识别在线程中执行，所有连接共享解码器和模型（generate会修改模型内部kwargs），需串行执行
+        self.inference_lock = threading.Lock()
 
         self.model = AutoModel(
             model=self.model_dir,
@@ -44,45 +71,71 @@ class FunASR(ASR):
 
     def save_audio_to_file(self, opus_data: List[bytes], session_id: str) -> str:
         """将Opus音频数据解码并保存为WAV文件"""
+        with self.inference_lock:
+            pcm_data = self.decode_opus(opus_data, session_id)
+        return self.save_pcm_to_file(pcm_data, session_id)
+
+    def save_pcm_to_file(self, pcm_data: bytes, session_id: str) -> str:
+        """将PCM数据保存为WAV文件"""
+        # 首次保存时再创建输出目录
+        os.makedirs(self.output_dir, exist_ok=True)
         file_name = f"asr_{session_id}_{uuid.uuid4()}.wav"
         file_path = os.path.join(self.output_dir, file_name)
 
-        decoder = opuslib.Decoder(16000, 1)  # 16kHz, 单声道
-        pcm_data = []
-
-        for opus_packet in opus_data:
-            try:
-                pcm_frame = decoder.decode(opus_packet, 960)  # 960 samples = 60ms
-                pcm_data.append(pcm_frame)
-            except opuslib.OpusError as e:
-                logger.bind(tag=TAG).error(f"Opus解码错误: {e}", exc_info=True)
-
         with wave.open(file_path, "wb") as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)  # 2 bytes = 16-bit
             wf.setframerate(16000)
-            wf.writeframes(b"".join(pcm_data))
+            wf.writeframes(pcm_data)
 
         return file_path
 
+    def decode_opus(self, opus_data: List[bytes], session_id: str) -> bytearray:
+        """将Opus音频数据解码为16kHz单声道PCM，调用方需持有inference_lock"""
+        # 复用解码器，每段语音前重置状态
+        self.decoder.reset_state()
+        pcm_data = bytearray()
+
+        for opus_packet in opus_data:
+            # 不超过2字节的包只有TOC头不含音频数据（RFC 6716 DTX），直接填充静音
+            if len(opus_packet) <= 2:
+                pcm_data.extend(SILENCE_PCM_FRAME)
+                continue
+            try:
+                pcm_data.extend(self.decoder.decode(opus_packet, 960))  # 960 samples = 60ms
+            except opuslib.OpusError as e:
+                logger.bind(tag=TAG).error(f"Opus解码错误: {e}", exc_info=True)
+
+        return pcm_data
+
     def speech_to_text(self, opus_data: List[bytes], session_id: str) -> Tuple[Optional[str], Optional[str]]:
-        """语音转文本主处理逻辑"""
+        """语音转文本主处理逻辑，删除音频文件（delete_audio）时不落盘，返回的路径为None"""
         file_path = None
         try:
-            # 保存音频文件
-            start_time = time.time()
-            file_path = self.save_audio_to_file(opus_data, session_id)
-            logger.bind(tag=TAG).debug(f"音频文件保存耗时: {time.time() - start_time:.3f}s | 路径: {file_path}")
-
-            # 语音识别
-            start_time = time.time()
-            result = self.model.generate(
-                input=file_path,
-                cache={},
-                language="auto",
-                use_itn=True,
-                batch_size_s=60,
-            )
+            with self.inference_lock:
+                # 解码音频，仅在需要保留音频时写入文件
+                start_time = time.time()
+                pcm_data = self.decode_opus(opus_data, session_id)
+                logger.bind(tag=TAG).debug(f"音频解码耗时: {time.time() - start_time:.3f}s")
+                if not self.delete_audio_file:
+                    start_time = time.time()
+                    file_path = self.save_pcm_to_file(pcm_data, session_id)
+                    logger.bind(tag=TAG).debug(f"音频文件保存耗时: {time.time() - start_time:.3f}s | 路径: {file_path}")
+
+                # 语音识别，直接传入内存中的音频数据
+                start_time = time.time()
+                audio = np.frombuffer(pcm_data, dtype=np.int16)
+                if self.trim_silence_enabled:
+                    audio = trim_silence(audio, threshold=self.trim_silence_threshold,
+                                         padding=self.trim_silence_padding_ms // 10)
+                audio = audio.astype(np.float32) / 32768.0
+                result = self.model.generate(
+                    input=audio,
+                    cache={},
+                    language="auto",
+                    use_itn=True,
+                    batch_size_s=60,
+                )
             text = rich_transcription_postprocess(result[0]["text"])
             logger.bind(tag=TAG).debug(f"语音识别耗时: {time.time() - start_time:.3f}s | 结果: {text}")
 
@@ -92,15 +145,6 @@ class FunASR(ASR):
             logger.bind(tag=TAG).error(f"语音识别失败: {e}", exc_info=True)
             return None, None
 
-        finally:
-            # 文件清理逻辑
-            if self.delete_audio_file and file_path and os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                    logger.bind(tag=TAG).debug(f"已删除临时音频文件: {file_path}")
-                except Exception as e:
-                    logger.bind(tag=TAG).error(f"文件删除失败: {file_path} | 错误: {e}")
-
 
 def create_instance(class_name: str, *args, **kwargs) -> ASR:
     """工厂方法创建ASR实例"""
@@ -35,29 +35,34 @@ class SileroVAD(VAD):
 
             # 处理缓冲区中的完整帧（每次处理512采样点）
             client_have_voice = False
-            while len(conn.client_audio_buffer) >= 512 * 2:
-                # 提取前512个采样点（1024字节）
-                chunk = conn.client_audio_buffer[:512 * 2]
-                conn.client_audio_buffer = conn.client_audio_buffer[512 * 2:]
+            buffer = memoryview(conn.client_audio_buffer)
+            offset = 0
+            try:
+                while len(buffer) - offset >= 512 * 2:
+                    # 提取前512个采样点（1024字节），memoryview切片不复制数据
+                    chunk = buffer[offset:offset + 512 * 2]
+                    offset += 512 * 2
 
-                # 转换为模型需要的张量格式
-                audio_int16 = np.frombuffer(chunk, dtype=np.int16)
-                audio_float32 = audio_int16.astype(np.float32) / 32768.0
-                audio_tensor = torch.from_numpy(audio_float32)
+                    # 转换为模型需要的张量格式
+                    audio_int16 = np.frombuffer(chunk, dtype=np.int16)
+                    audio_float32 = audio_int16.astype(np.float32) / 32768.0
+                    audio_tensor = torch.from_numpy(audio_float32)
 
-                # 检测语音活动
-                speech_prob = self.model(audio_tensor, 16000).item()
-                client_have_voice = speech_prob >= self.vad_threshold
-
-                # 如果之前有声音，但本次没有声音，且与上次有声音的时间查已经超过了静默阈值，则认为已经说完一句话
-                if conn.client_have_voice and not client_have_voice:
-                    stop_duration = time.time() * 1000 - conn.client_have_voice_last_time
-                    if stop_duration >= self.silence_threshold_ms:
-                        conn.client_voice_stop = True
-                if client_have_voice:
-                    conn.client_have_voice = True
-                    conn.client_have_voice_last_time = time.time() * 1000
+                    # 检测语音活动
+                    speech_prob = self.model(audio_tensor, 16000).item()
+                    client_have_voice = speech_prob >= self.vad_threshold
 
+                    # 如果之前有声音，但本次没有声音，且与上次有声音的时间查已经超过了静默阈值，则认为已经说完一句话
+                    if conn.client_have_voice and not client_have_voice:
+                        stop_duration = time.time() * 1000 - conn.client_have_voice_last_time
+                        if stop_duration >= self.silence_threshold_ms:
+                            conn.client_voice_stop = True
+                    if client_have_voice:
+                        conn.client_have_voice = True
+                        conn.client_have_voice_last_time = time.time() * 1000
+            finally:
+                # 已取出的窗口（包括推理出错的窗口）都从缓冲区移除，只保留未处理的剩余数据
+                conn.client_audio_buffer = bytes(buffer[offset:])
             return client_have_voice
         except opuslib.OpusError as e:
             logger.bind(tag=TAG).info(f"解码错误: {e}")
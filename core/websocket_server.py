@@ -49,10 +49,12 @@ class WebSocketServer:
 
         self.logger.bind(tag=TAG).info("Server is running at ws://{}:{}", get_local_ip(), port)
         self.logger.bind(tag=TAG).info("=======上面的地址是websocket协议地址，请勿用浏览器访问=======")
+        # 音频帧均为已压缩的opus数据，关闭permessage-deflate避免重复压缩
         async with websockets.serve(
                 self._handle_connection,
                 host,
-                port
+                port,
+                compression=None
         ):
             await asyncio.Future()
 